@@ -110,7 +110,7 @@ class Checks:
         Octokit.info("Total Code Scanning Alerts :: " + str(len(alerts)))
 
         for alert in alerts:
-            Octokit.debug(f"Processing Alert :: {alert} ({alert.severity})")
+            Octokit.debug("Processing Alert :: %s (%s)", alert, alert.severity)
             severity = alert.severity
             rule_name = alert.description
 
@@ -370,7 +370,7 @@ class Checks:
 
         for warning in warnings:
             if warning.name in ignores_names or warning.license in ignores_ids:
-                Octokit.debug(f"Skipping {warning} because in ignore list...")
+                Octokit.debug("Skipping %s because in ignore list...", warning)
                 continue
 
             licensing_warnings.append(
@@ -399,7 +399,7 @@ class Checks:
 
         for violation in violations:
             if violation.name in ignores_names or violation.license in ignores_ids:
-                Octokit.debug(f"Skipping {violation} because in ignore list...")
+                Octokit.debug("Skipping %s because in ignore list...", violation)
                 continue
 
             licensing_violations.append(
@@ -13,6 +13,8 @@ SEVERITIES = [
     "note",
     "notes",
 ]
+# Position of each severity in SEVERITIES
+SEVERITY_INDEX = {severity: index for index, severity in enumerate(SEVERITIES)}
 
 TECHNOLOGIES = [
     "codescanning",
@@ -30,6 +32,8 @@ LICENSES = [
     "LGPL-3.0 License",
     "LGPL-2.1",
 ]
+# Lowercased LICENSES for lookups
+LICENSES_LOWER = frozenset(license.lower() for license in LICENSES)
 
 # API string, Pretty Print, raise exception?
 API_ERRORS = [
@@ -26,12 +26,20 @@ class Octokit:
         print(msg)
 
     @staticmethod
-    def debug(msg):
-        """Logging Debugging"""
-        logging.debug(msg)
-        if Octokit.logger.level == logging.DEBUG and Octokit.__EVENT__:
+    def debug(msg, *args):
+        """Logging Debugging
+
+        `args` are %-formatted into `msg` only when debugging is enabled
+        """
+        logging.debug(msg, *args)
+        if Octokit.logger.level != logging.DEBUG:
+            return
+        if args:
+            msg = msg % args
+
+        if Octokit.__EVENT__:
             print("::debug :: {msg}".format(msg=msg))
-        elif Octokit.logger.level == logging.DEBUG:
+        else:
             print("[*] " + msg)
 
     @staticmethod
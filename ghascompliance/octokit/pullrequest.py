@@ -38,7 +38,7 @@ class PullRequest:
                 Octokit.info(
                     "Found an existing comment from PaC, updating that comment..."
                 )
-                Octokit.debug(f"Comment ID :: {comment_id}")
+                Octokit.debug("Comment ID :: %s", comment_id)
                 Summary.addRaw(f"Updating the comment at {datetime.datetime.today()}")
                 GitHub.repository.updatePullRequestComment(comment_id, Summary.summary)
             # Else, add a new comment
@@ -56,7 +56,7 @@ class PullRequest:
     def findComment(comment_body_includes: str) -> Union[int, None]:
         """Finds a comment in the PR containing the given string."""
         comments = GitHub.repository.getPullRequestComments()
-        Octokit.debug(f"Found {len(comments)} comments in this PR.")
+        Octokit.debug("Found %s comments in this PR.", len(comments))
         for comment in comments:
             if comment_body_includes in comment.get("body", ""):
                 return comment.get("id", None)
@@ -1,19 +1,172 @@
 import os
+import re
+import copy
+import contextlib
 import json
 import yaml
 import shutil
+import hashlib
 import fnmatch
+import functools
 import datetime
 import tempfile
+import requests
+import subprocess
+from collections import OrderedDict
+from urllib.parse import urlparse
 from typing import List, Dict, Optional
 
-from ghastoolkit import Repository
+from ghastoolkit import GitHub, Repository
 
-from ghascompliance.consts import SEVERITIES, TECHNOLOGIES, LICENSES
+from ghascompliance.consts import (
+    SEVERITIES,
+    SEVERITY_INDEX,
+    TECHNOLOGIES,
+    LICENSES_LOWER,
+)
 from ghascompliance.octokit import Octokit
 
 __ROOT__ = os.path.dirname(os.path.basename(__file__))
+__TEMP_DIR__ = tempfile.gettempdir()
 __SCHEMA_VALIDATION__ = "Schema Validation Failed :: {msg} - {value}"
+# Characters removed from imported files
+__IMPORT_STRIP_TABLE__ = str.maketrans("", "", "\b")
+
+# Use the libyaml backed loader if PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed policy files keyed by path, invalidated on mtime / size change
+__POLICY_CACHE__: "OrderedDict[str, tuple]" = OrderedDict()
+__POLICY_CACHE_SIZE__ = 100
+# Opt-in JSON sidecar (`<policy>.cache.json`) for repeated runs
+__POLICY_JSON_CACHE_ENV__ = "GHAS_POLICY_JSON_CACHE"
+# Opt-in reuse of an existing policy repository clone
+__POLICY_REUSE_CLONE_ENV__ = "GHAS_POLICY_REUSE_CLONE"
+# Most recent violation decisions kept per policy
+__DECISION_CACHE_SIZE__ = 4096
+# Unacceptable severities for each level, built on first use
+__SEVERITY_LISTS__: Dict[str, tuple] = {}
+# Shared empty section for lookups, never modified
+__EMPTY__: dict = {}
+
+
+class Validators:
+    """Compiled validators, literal names are matched without using a regex"""
+
+    __slots__ = ("literals", "pattern")
+
+    def __init__(self, validators: tuple):
+        literals = set()
+        wildcards = []
+        for validator in validators:
+            if any(char in "*?[" for char in validator):
+                wildcards.append(validator)
+            else:
+                literals.add(validator)
+
+        self.literals = frozenset(literals)
+        self.pattern = (
+            re.compile("|".join(fnmatch.translate(w) for w in wildcards))
+            if wildcards
+            else None
+        )
+
+    def match(self, name: str) -> bool:
+        if name in self.literals:
+            return True
+        return self.pattern is not None and self.pattern.match(name) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def compileValidators(validators: tuple) -> Validators:
+    """Compile wildcard validators"""
+    return Validators(validators)
+
+
+@functools.lru_cache(maxsize=None)
+def remediationDelta(days) -> datetime.timedelta:
+    """Time to remediate for a number of days"""
+    return datetime.timedelta(days=int(days))
+
+
+def parsePolicyFile(path: str) -> dict:
+    """Parse a YAML policy file (single read, decoding is left to the loader)"""
+    with open(path, "rb") as handle:
+        content = handle.read()
+    return yaml.load(content, Loader=YamlLoader)
+
+
+def loadPolicyFile(path: str) -> dict:
+    """Load and parse a policy file, reusing the parsed data if unchanged"""
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = __POLICY_CACHE__.get(key)
+    if cached and cached[0] == version:
+        Octokit.debug("Using cached policy file - %s", path)
+        __POLICY_CACHE__.move_to_end(key)
+        # loadPolicy modifies the data in place
+        return copy.deepcopy(cached[1])
+
+    if os.environ.get(__POLICY_JSON_CACHE_ENV__) == "1":
+        data = loadPolicyFileJsonCache(path)
+    else:
+        data = parsePolicyFile(path)
+
+    __POLICY_CACHE__[key] = (version, data)
+    __POLICY_CACHE__.move_to_end(key)
+    if len(__POLICY_CACHE__) > __POLICY_CACHE_SIZE__:
+        __POLICY_CACHE__.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+def loadPolicyFileJsonCache(path: str) -> dict:
+    """Load a policy file using a JSON sidecar cache of the same YAML content"""
+    cache_path = path + ".cache.json"
+
+    with open(path, "rb") as handle:
+        content = handle.read()
+    # the sidecar is only trusted for the exact YAML it was created from
+    source = hashlib.sha256(content).hexdigest()
+
+    try:
+        with open(cache_path, "r") as handle:
+            cache = json.load(handle)
+        if isinstance(cache, dict) and cache.get("sha256") == source:
+            Octokit.debug("Using JSON policy cache - %s", cache_path)
+            return cache.get("policy")
+        Octokit.debug("JSON policy cache does not match policy file, ignoring")
+    except (OSError, ValueError):
+        pass
+
+    data = yaml.load(content, Loader=YamlLoader)
+
+    try:
+        cache = json.dumps({"sha256": source, "policy": data})
+        # Only cache policies that survive the round trip (no dates, int keys, ...)
+        if json.loads(cache).get("policy") != data:
+            Octokit.debug("Policy can not be cached as JSON, skipping")
+            return data
+
+        directory = os.path.dirname(os.path.abspath(cache_path))
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, suffix=".tmp", delete=False
+        ) as handle:
+            try:
+                handle.write(cache)
+                handle.close()
+                os.replace(handle.name, cache_path)
+            except Exception:
+                # never leave a partial sidecar next to the policy file
+                with contextlib.suppress(OSError):
+                    os.unlink(handle.name)
+                raise
+    except (OSError, TypeError, ValueError) as err:
+        Octokit.debug("Unable to write JSON policy cache :: %s", err)
+
+    return data
 
 
 class Policy:
@@ -21,6 +174,25 @@ class Policy:
     __SECTION_ITEMS__ = ["level", "remediate", "conditions", "warnings", "ignores"]
     __IMPORT_ALLOWED_TYPES__ = ["txt"]
 
+    __slots__ = (
+        "name",
+        "risk_level",
+        "severities",
+        "today",
+        "_policy",
+        "_validators",
+        "_decisions",
+        "_license_warnings",
+        "_imports",
+        "remediate",
+        "instance",
+        "token",
+        "isGithubAppToken",
+        "repository",
+        "repository_path",
+        "temp_repo",
+    )
+
     def __init__(
         self,
         severity: str = "error",
@@ -35,6 +207,7 @@ class Policy:
         self.risk_level = severity
 
         self.severities = self._buildSeverityList(severity)
+        self.today = datetime.datetime.now().date()
 
         self.policy = {}
         self.remediate = None
@@ -60,53 +233,187 @@ class Policy:
         elif path and path != "":
             self.loadLocalConfig(path)
 
+    @property
+    def policy(self) -> dict:
+        """Loaded policy, call `clearCaches()` after changing it in place"""
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: dict):
+        self._policy = policy
+        self.clearCaches()
+
+    def clearCaches(self):
+        """Clear everything cached from the current policy"""
+        self._validators = {}
+        self._decisions = OrderedDict()
+        self._license_warnings = set()
+        self._imports = {}
+
+    def getValidators(self, technology: str, section: str, *blocks: str) -> Validators:
+        """Get the lowercased and compiled validators of one or more policy blocks"""
+        key = (technology, section, blocks)
+        validators = self._validators.get(key)
+        if validators is None:
+            data = (self.policy.get(technology) or __EMPTY__).get(section) or __EMPTY__
+            validators = compileValidators(
+                tuple(
+                    str(value).lower()
+                    for block in blocks
+                    for value in data.get(block) or []
+                )
+            )
+            self._validators[key] = validators
+        return validators
+
     def loadFromRepo(self):
         """Load policy from repository"""
         if not self.repository:
             raise Exception(f"Loading from repository but no repository is set")
 
+        policy_path = self.repository_path or "policy.yml"
+
+        # Only the policy file is needed unless it imports other files
+        content = self.fetchPolicyFile(policy_path)
+        if content is not None:
+            policy = yaml.load(content, Loader=YamlLoader)
+            if isinstance(policy, dict) and not Policy.hasPolicyImports(policy):
+                Octokit.info(f"Loaded policy file from repository - {policy_path}")
+                self.loadPolicy(policy)
+                return
+            Octokit.debug("Policy imports files from the repository, cloning")
+
         # setup
-        self.repository.clone_path = os.path.join(tempfile.gettempdir(), "repo")
+        self.repository.clone_path = os.path.join(__TEMP_DIR__, "repo")
         self.temp_repo = self.repository.clone_path
-        Octokit.debug(f"Clone Policy URL :: {self.repository.clone_url}")
+        Octokit.debug("Clone Policy URL :: %s", self.repository.clone_url)
 
-        if os.path.exists(self.repository.clone_path):
-            Octokit.debug("Deleting existing temp path")
-            shutil.rmtree(self.repository.clone_path)
+        if os.environ.get(__POLICY_REUSE_CLONE_ENV__) == "1" and self.updateClone():
+            Octokit.info(f"Reusing cloned policy repo - {self.repository}")
+        else:
+            if os.path.exists(self.repository.clone_path):
+                Octokit.debug("Deleting existing temp path")
+                shutil.rmtree(self.repository.clone_path)
 
-        Octokit.info(f"Cloning policy repo - {self.repository}")
-        self.repository.clone(clobber=True, depth=1)
+            Octokit.info(f"Cloning policy repo - {self.repository}")
+            self.repository.clone(clobber=True, depth=1)
 
-        if (
-            not os.path.exists(self.repository.clone_path)
-            and not self.repository.is_github_app_token
-        ):
-            # Try as a GitHub App Token
-            Octokit.info("Retrying as GitHub App Token")
+            if (
+                not os.path.exists(self.repository.clone_path)
+                and not self.repository.is_github_app_token
+            ):
+                # Try as a GitHub App Token
+                Octokit.info("Retrying as GitHub App Token")
 
-            self.repository.is_github_app_token = True
-            self.repository.clone(clobber=True, depth=1)
+                self.repository.is_github_app_token = True
+                self.repository.clone(clobber=True, depth=1)
 
         if not os.path.exists(self.repository.clone_path):
             raise Exception("Repository failed to clone")
 
         # get the policy file
-        full_path = self.repository.getFile(self.repository_path or "policy.yml")
+        full_path = self.repository.getFile(policy_path)
 
         self.loadLocalConfig(full_path)
 
+    def updateClone(self) -> bool:
+        """Update an existing clone of the policy repository in place"""
+        clone_path = self.repository.clone_path
+        if not os.path.isdir(os.path.join(clone_path, ".git")):
+            return False
+
+        try:
+            remote = subprocess.check_output(
+                ["git", "config", "--get", "remote.origin.url"], cwd=clone_path
+            )
+            # tokens change between runs so only compare the repository
+            existing = Policy.repositoryLocation(remote.decode().strip())
+            if existing != Policy.repositoryLocation(self.repository.clone_url):
+                Octokit.debug("Existing clone is for a different repository")
+                return False
+
+            # fetch with the current credentials, not the ones of the old clone
+            branch = self.repository.branch or "HEAD"
+            commands = [
+                ["git", "fetch", "--depth=1", self.repository.clone_url, branch],
+                ["git", "reset", "--hard", "FETCH_HEAD"],
+                ["git", "clean", "-ffdx"],
+            ]
+            for cmd in commands:
+                subprocess.check_call(
+                    cmd,
+                    cwd=clone_path,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+        except subprocess.CalledProcessError as err:
+            # the command contains the clone url (and token), only log the status
+            Octokit.debug("Unable to update existing clone :: exit %s", err.returncode)
+            return False
+        except OSError as err:
+            Octokit.debug("Unable to update existing clone :: %s", err)
+            return False
+
+        return True
+
+    @staticmethod
+    def repositoryLocation(url: str) -> str:
+        """Get the host and repository of a clone url without any credentials"""
+        parsed = urlparse(url)
+        host = parsed.netloc.rsplit("@", 1)[-1].lower()
+        path = parsed.path.strip("/").lower()
+        if path.endswith(".git"):
+            path = path[: -len(".git")]
+        return f"{host}/{path}"
+
+    def fetchPolicyFile(self, path: str) -> Optional[bytes]:
+        """Fetch the policy file from the repository using the REST API"""
+        api_rest, _ = GitHub.parseInstance(self.instance)
+        url = "{api}/repos/{owner}/{repo}/contents/{path}".format(
+            api=api_rest,
+            owner=self.repository.owner,
+            repo=self.repository.repo,
+            path=path.lstrip("/"),
+        )
+        headers = {"Accept": "application/vnd.github.raw"}
+        if self.token:
+            headers["Authorization"] = f"token {self.token}"
+        params = {"ref": self.repository.branch} if self.repository.branch else {}
+
+        try:
+            response = requests.get(url, headers=headers, params=params, timeout=30)
+        except requests.RequestException as err:
+            Octokit.debug("Unable to fetch policy file :: %s", err)
+            return None
+
+        if response.status_code != 200:
+            Octokit.debug("Unable to fetch policy file :: %s", response.status_code)
+            return None
+        return response.content
+
+    @staticmethod
+    def hasPolicyImports(policy: dict) -> bool:
+        """Check if any section of the policy imports files"""
+        for section in policy.values():
+            if not isinstance(section, dict):
+                continue
+            for section_data in section.values():
+                if isinstance(section_data, dict) and section_data.get("imports"):
+                    return True
+        return False
+
     def loadLocalConfig(self, path: str):
         Octokit.info(f"Loading policy file - {path}")
 
-        if not os.path.exists(path):
+        try:
+            policy = loadPolicyFile(path)
+        except FileNotFoundError:
             raise Exception(f"Policy File does not exist - {path}")
 
-        with open(path, "r") as handle:
-            policy = yaml.safe_load(handle)
-
         self.loadPolicy(policy)
 
     def loadPolicy(self, policy: dict):
+        self.clearCaches()
         self.name = policy.get("name", "")
 
         if not policy.get("general"):
@@ -153,12 +460,12 @@ class Policy:
 
             # Time to Remediate
             if section == "remediate":
-                Octokit.debug("Enabling Time to Remediate (section) :: " + name)
+                Octokit.debug("Enabling Time to Remediate (section) :: %s", name)
                 time_to_remediate_policy = True
                 continue
 
             # Validate blocks
-            for block in list(section_data):
+            for block in section_data:
                 if block not in Policy.__BLOCK_ITEMS__:
                     raise Exception(
                         __SCHEMA_VALIDATION__.format(
@@ -167,8 +474,9 @@ class Policy:
                     )
 
             # Importing
-            if section_data.get("imports"):
-                if section_data.get("imports", {}).get("imports"):
+            imports = section_data.get("imports")
+            if imports:
+                if imports.get("imports"):
                     raise Exception(
                         __SCHEMA_VALIDATION__.format(
                             msg="Circular import", value="imports"
@@ -176,14 +484,13 @@ class Policy:
                     )
 
                 for block in Policy.__BLOCK_ITEMS__:
-                    Octokit.debug(f"Importing > {section} - {block}")
-
-                    import_path = section_data.get("imports", {}).get(block)
+                    import_path = imports.get(block)
                     if import_path and isinstance(import_path, str):
-                        if section_data.get(block):
-                            section_data[block].extend(
-                                self.loadPolicyImport(import_path)
-                            )
+                        Octokit.debug("Importing > %s - %s", section, block)
+
+                        current = section_data.get(block)
+                        if current:
+                            current.extend(self.loadPolicyImport(import_path))
                         else:
                             section_data[block] = self.loadPolicyImport(import_path)
 
@@ -194,6 +501,12 @@ class Policy:
         return data
 
     def loadPolicyImport(self, path: str):
+        cached = self._imports.get(path)
+        if cached is not None:
+            Octokit.debug("Using cached import :: %s", path)
+            # callers extend the returned list
+            return list(cached)
+
         results = []
         traversal = False
         paths = [
@@ -207,8 +520,8 @@ class Policy:
         for root, path in paths:
             full_path = os.path.abspath(os.path.join(root, path))
 
-            if os.path.exists(full_path) and os.path.isfile(full_path):
-                if full_path.startswith(tempfile.gettempdir()):
+            if os.path.isfile(full_path):
+                if full_path.startswith(__TEMP_DIR__):
                     Octokit.debug("Temp location used for import path")
                 elif not full_path.startswith(root):
                     Octokit.error("Attempting to import file :: " + full_path)
@@ -227,23 +540,24 @@ class Policy:
                 Octokit.info("Importing Path :: " + full_path)
 
                 with open(full_path, "r") as handle:
-                    for line in handle:
-                        line = line.replace("\n", "").replace("\b", "")
-                        if line == "" or line.startswith("#"):
-                            continue
-                        results.append(line)
-
-                return results
+                    content = handle.read().translate(__IMPORT_STRIP_TABLE__)
+
+                results = [
+                    line
+                    for line in content.splitlines()
+                    if line != "" and not line.startswith("#")
+                ]
+                self._imports[path] = results
+                return list(results)
         Octokit.warning(f"Unable to import file :: {path}")
         return results
 
     def savePolicy(self, path: str):
-        #  Always clear the file
         Octokit.info("Saving Policy...")
-        if os.path.exists(path):
-            os.remove(path)
+        # "w" always clears the file
         with open(path, "w") as handle:
-            json.dump(self.policy, handle, indent=2)
+            # json.dumps (not json.dump) without indent uses the C encoder
+            handle.write(json.dumps(self.policy, separators=(",", ":")))
         Octokit.info("Policy saved")
 
     def _buildSeverityList(self, severity: str):
@@ -251,58 +565,56 @@ class Policy:
             raise Exception("`security` is set to None/Null")
 
         severity = severity.lower()
-        severities = []
+
+        severities = __SEVERITY_LISTS__.get(severity)
+        if severities is not None:
+            return severities
 
         if severity == "none":
             Octokit.debug("No Unacceptable Severities")
-            return []
+            severities = ()
         elif severity == "all":
-            Octokit.debug("Unacceptable Severities :: " + ",".join(SEVERITIES))
-            return SEVERITIES
-        elif severity in SEVERITIES:
-            severities = SEVERITIES[: SEVERITIES.index(severity) + 1]
-            Octokit.debug("Unacceptable Severities :: " + ",".join(severities))
+            Octokit.debug("Unacceptable Severities :: %s", ",".join(SEVERITIES))
+            severities = tuple(SEVERITIES)
+        elif severity in SEVERITY_INDEX:
+            severities = tuple(SEVERITIES[: SEVERITY_INDEX[severity] + 1])
+            Octokit.debug("Unacceptable Severities :: %s", ",".join(severities))
         else:
             Octokit.warning(f"Unknown severity provided :: {severity}")
+            return ()
+
+        __SEVERITY_LISTS__[severity] = severities
         return severities
 
     def matchContent(self, name: str, validators: List[str]):
         # Wildcard matching
-        for validator in validators:
-            results = fnmatch.filter([name], validator)
-            if results:
-                return True
-        return False
+        return compileValidators(tuple(validators)).match(name)
 
     def checkTechnologyActive(self, technology: str):
-        return self.policy.get(technology, {}).get("level", "") != "disabled"
+        return self.policy.get(technology, __EMPTY__).get("level", "") != "disabled"
 
     def checkViolationRemediation(
         self,
         severity: str,
         remediate: dict,
-        creation_time: datetime.datetime,
+        creation_time: Optional[datetime.datetime],
     ):
-        # Midnight "today"
-        now = datetime.datetime.now().date()
+        if not creation_time:
+            return False
 
-        if creation_time and remediate.get(severity):
-            alert_datetime = creation_time + datetime.timedelta(
-                days=int(remediate.get(severity))
-            )
-            if now > alert_datetime.date():
-                return True
+        # Midnight "today", fixed for the whole run
+        now = self.today
+        created = creation_time.date()
 
-        else:
-            for remediate_severity, remediate_delta in remediate.items():
-                remediate_severity_list = self._buildSeverityList(remediate_severity)
+        if remediate.get(severity):
+            return now > created + remediationDelta(remediate.get(severity))
 
-                if severity in remediate_severity_list:
-                    alert_datetime = creation_time + datetime.timedelta(
-                        days=int(remediate_delta)
-                    )
-                    if now > alert_datetime.date():
-                        return True
+        for remediate_severity, remediate_delta in remediate.items():
+            remediate_severity_list = self._buildSeverityList(remediate_severity)
+
+            if severity in remediate_severity_list:
+                if now > created + remediationDelta(remediate_delta):
+                    return True
 
         return False
 
@@ -310,24 +622,65 @@ class Policy:
         self,
         severity: str,
         technology: str,
-        names: List[str] = [],
-        ids: List[str] = [],
-        creation_time: datetime.datetime = None,
+        names: Optional[List[str]] = None,
+        ids: Optional[List[str]] = None,
+        creation_time: Optional[datetime.datetime] = None,
     ):
         severity = severity.lower()
 
         if not technology or technology == "":
             raise Exception("Technology is set to None")
 
-        if self.policy.get(technology, {}).get("remediate"):
+        policy = self.policy.get(technology, __EMPTY__)
+
+        # the creation date only matters when remediation is enabled
+        created = None
+        if creation_time and policy.get("remediate"):
+            created = creation_time.date()
+
+        key = (
+            severity,
+            technology,
+            tuple(names or ()),
+            tuple(ids or ()),
+            created,
+            self.today,
+        )
+        result = self._decisions.get(key)
+        if result is not None:
+            self._decisions.move_to_end(key)
+            return result
+
+        result = self._checkViolation(
+            severity, technology, policy, names, ids, creation_time
+        )
+        self._decisions[key] = result
+        if len(self._decisions) > __DECISION_CACHE_SIZE__:
+            self._decisions.popitem(last=False)
+        return result
+
+    def _checkViolation(
+        self,
+        severity: str,
+        technology: str,
+        policy: dict,
+        names: Optional[List[str]],
+        ids: Optional[List[str]],
+        creation_time: Optional[datetime.datetime],
+    ):
+        if not policy and self.policy:
+            # No section for the technology, all severities are violations
+            return severity in SEVERITIES
+
+        if policy.get("remediate"):
             Octokit.debug("Checking violation against remediate configuration")
 
-            remediate_policy = self.policy.get(technology, {}).get("remediate")
+            remediate_policy = policy.get("remediate")
 
             violation_remediation = self.checkViolationRemediation(
                 severity, remediate_policy, creation_time
             )
-            if self.policy.get(technology, {}).get("level"):
+            if policy.get("level"):
                 return violation_remediation and self.checkViolationAgainstPolicy(
                     severity, technology, names=names, ids=ids
                 )
@@ -349,7 +702,11 @@ class Policy:
             return severity in self.severities
 
     def checkViolationAgainstPolicy(
-        self, severity: str, technology: str, names: List[str] = [], ids: List[str] = []
+        self,
+        severity: str,
+        technology: str,
+        names: Optional[List[str]] = None,
+        ids: Optional[List[str]] = None,
     ):
         severities = []
         level = "all"
@@ -357,37 +714,30 @@ class Policy:
         if technology:
             policy = self.policy.get(technology)
             if policy:
-                for name in names:
-                    check_name = str(name).lower()
-                    condition_names = [
-                        ign.lower()
-                        for ign in policy.get("conditions", {}).get("names", [])
-                    ]
-                    ingores_names = [
-                        ign.lower()
-                        for ign in policy.get("ignores", {}).get("names", [])
-                    ]
-                    if self.matchContent(check_name, ingores_names):
-                        return False
-                    elif self.matchContent(check_name, condition_names):
-                        return True
-
-                for id in ids:
-                    check_id = str(id).lower()
-                    condition_ids = [
-                        ign.lower()
-                        for ign in policy.get("conditions", {}).get("ids", [])
-                    ]
-                    ingores_ids = [
-                        ign.lower() for ign in policy.get("ignores", {}).get("ids", [])
-                    ]
-                    if self.matchContent(check_id, ingores_ids):
-                        return False
-                    elif self.matchContent(check_id, condition_ids):
-                        return True
-
-            if self.policy.get(technology, {}).get("level"):
-                level = self.policy.get(technology, {}).get("level")
+                if names:
+                    ignores_names = self.getValidators(technology, "ignores", "names")
+                    condition_names = self.getValidators(
+                        technology, "conditions", "names"
+                    )
+                    for name in names:
+                        check_name = str(name).lower()
+                        if ignores_names.match(check_name):
+                            return False
+                        elif condition_names.match(check_name):
+                            return True
+
+                if ids:
+                    ignores_ids = self.getValidators(technology, "ignores", "ids")
+                    condition_ids = self.getValidators(technology, "conditions", "ids")
+                    for id in ids:
+                        check_id = str(id).lower()
+                        if ignores_ids.match(check_id):
+                            return False
+                        elif condition_ids.match(check_id):
+                            return True
+
+            if policy and policy.get("level"):
+                level = policy.get("level")
                 severities = self._buildSeverityList(level)
         else:
             severities = self.severities
@@ -399,63 +749,54 @@ class Policy:
 
         return severity in severities
 
-    def checkLicensingViolation(self, license: str, dependency: dict = {}):
+    def checkLicensingViolation(self, license: str, dependency: Optional[dict] = None):
         license = license.lower()
 
         # Policy as Code
         if self.policy and self.policy.get("licensing"):
             return self.checkLicensingViolationAgainstPolicy(license, dependency)
 
-        return license in [l.lower() for l in LICENSES]
+        return license in LICENSES_LOWER
 
-    def checkLicensingViolationAgainstPolicy(self, license: str, dependency: dict = {}):
-        policy = self.policy.get("licensing")
+    def checkLicensingViolationAgainstPolicy(
+        self, license: str, dependency: Optional[dict] = None
+    ):
         license = license.lower()
+        dependency = dependency or {}
 
         dependency_short_name = dependency.get("name", "NA")
         dependency_name = (
             dependency.get("manager", "NA") + "://" + dependency.get("name", "NA")
         )
         dependency_full = dependency.get("full_name", "NA://NA#NA")
+        # validators are lowercased so match the dependency case-insensitively
+        check_short_name = dependency_short_name.lower()
+        check_name = dependency_name.lower()
+        check_full = dependency_full.lower()
 
         # gather warning ids and names
-        warning_ids = [wrn.lower() for wrn in policy.get("warnings", {}).get("ids", [])]
-        warning_names = [
-            wrn.lower() for wrn in policy.get("warnings", {}).get("names", [])
-        ]
+        warning_ids = self.getValidators("licensing", "warnings", "ids")
+        warning_names = self.getValidators("licensing", "warnings", "names")
 
         #  if the license name is in the warnings list generate a warning
-        if self.matchContent(license, warning_ids) or self.matchContent(
-            dependency_full, warning_names
-        ):
-            Octokit.warning(
-                f"Dependency License Warning :: {dependency_full} = {license}"
-            )
-
-        # gather ignore ids and names
-        ingore_ids = [ign.lower() for ign in policy.get("ingores", {}).get("ids", [])]
-        ingore_names = [
-            ign.lower() for ign in policy.get("ingores", {}).get("names", [])
-        ]
+        if warning_ids.match(license) or warning_names.match(check_full):
+            # only warn once per dependency and license
+            if (dependency_full, license) not in self._license_warnings:
+                self._license_warnings.add((dependency_full, license))
+                Octokit.warning(
+                    f"Dependency License Warning :: {dependency_full} = {license}"
+                )
 
-        # gather condition ids and names
-        condition_ids = [
-            ign.lower() for ign in policy.get("conditions", {}).get("ids", [])
-        ]
-        conditions_names = [
-            ign.lower() for ign in policy.get("conditions", {}).get("names", [])
-        ]
+        # gather ignore and condition ids and names
+        ignores = self.getValidators("licensing", "ignores", "ids", "names")
+        conditions = self.getValidators("licensing", "conditions", "ids", "names")
 
-        for value in [license, dependency_full, dependency_name, dependency_short_name]:
+        for value in [license, check_full, check_name, check_short_name]:
             # return false (ignore) if name or id is defined in the ignore portion of the policy
-            if self.matchContent(value, ingore_ids) or self.matchContent(
-                value, ingore_names
-            ):
+            if ignores.match(value):
                 return False
             # annotate error and return true if name or id is defined as a condition
-            elif self.matchContent(value, condition_ids) or self.matchContent(
-                value, conditions_names
-            ):
+            elif conditions.match(value):
                 Octokit.error(
                     f"Dependency License Violation :: {dependency_full} == {license}"
                 )
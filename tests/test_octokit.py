@@ -2,12 +2,14 @@ import os
 import sys
 import yaml
 import uuid
+import logging
 import unittest
 import tempfile
+from unittest import mock
 
 sys.path.append(".")
 
-from ghascompliance.octokit.octokit import GitHub
+from ghascompliance.octokit.octokit import GitHub, Octokit
 
 
 class TestPolicyLoading(unittest.TestCase):
@@ -57,3 +59,31 @@ class TestPolicyLoading(unittest.TestCase):
         # not a pull request
         GitHub.init("advanced-security/policy-as-code", reference="refs/heads/main")
         self.assertFalse(GitHub.repository.isInPullRequest())
+
+
+class TestOctokitLogging(unittest.TestCase):
+    def setUp(self) -> None:
+        self.level = Octokit.logger.level
+
+    def tearDown(self) -> None:
+        Octokit.setLevel(self.level)
+
+    def testDebugFormatting(self):
+        Octokit.setLevel(logging.DEBUG)
+
+        with mock.patch("builtins.print") as printed:
+            Octokit.debug("Importing > %s - %s", "codescanning", "ids")
+            Octokit.debug("100% literal")
+
+        self.assertEqual(
+            printed.call_args_list[0].args[0], "[*] Importing > codescanning - ids"
+        )
+        self.assertEqual(printed.call_args_list[1].args[0], "[*] 100% literal")
+
+    def testDebugDisabled(self):
+        Octokit.setLevel(logging.INFO)
+
+        with mock.patch("builtins.print") as printed:
+            Octokit.debug("Importing > %s - %s", "codescanning", "ids")
+
+        self.assertFalse(printed.called)
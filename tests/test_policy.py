@@ -1,9 +1,12 @@
 import sys
 import unittest
+from unittest import mock
 
 sys.path.append(".")
 
+from ghascompliance import policy as policy_module
 from ghascompliance.policy import Policy
+from ghascompliance.octokit import Octokit
 
 
 class TestPolicies(unittest.TestCase):
@@ -88,6 +91,55 @@ class TestPolicies(unittest.TestCase):
             self.policy.checkLicensingViolationAgainstPolicy(faker["license"], faker)
         )
 
+    def testLicenseByDependencyNameCase(self):
+        django = {
+            "name": "Django",
+            "manager": "pip",
+            "full_name": "pip://Django#4.2.0",
+            "license": "BSD-3-Clause",
+        }
+
+        self.policy.policy = {"licensing": {"conditions": {"names": ["pip://django"]}}}
+        self.assertTrue(
+            self.policy.checkLicensingViolationAgainstPolicy(django["license"], django)
+        )
+
+        self.policy.policy = {
+            "licensing": {"conditions": {"names": ["PIP://DJANGO#*"]}}
+        }
+        self.assertTrue(
+            self.policy.checkLicensingViolationAgainstPolicy(django["license"], django)
+        )
+
+    def testLicenseIgnored(self):
+        mygpl = self.samples.get("mygpl")
+
+        self.policy.policy = {
+            "licensing": {
+                "conditions": {"ids": ["GPL-*"]},
+                "ignores": {"ids": [mygpl.get("license")]},
+            }
+        }
+
+        self.assertFalse(
+            self.policy.checkLicensingViolationAgainstPolicy(mygpl["license"], mygpl)
+        )
+
+    def testLicenseWarningOnce(self):
+        faker = self.samples.get("faker")
+
+        self.policy.policy = {"licensing": {"warnings": {"ids": ["MIT*"]}}}
+
+        with mock.patch.object(Octokit, "warning") as warning:
+            for _ in range(3):
+                self.assertFalse(
+                    self.policy.checkLicensingViolationAgainstPolicy(
+                        faker["license"], faker
+                    )
+                )
+
+        self.assertEqual(warning.call_count, 1)
+
     def testDependencyNamesDoNotMatch(self):
         self.policy.policy = {
             "dependencies": {
@@ -127,3 +179,71 @@ class TestPolicies(unittest.TestCase):
         names = ["pip://faker", "faker"]
 
         self.assertFalse(self.policy.checkViolation("all", "dependencies", names=names))
+
+    def testPolicyChangeResetsValidators(self):
+        self.policy.policy = {
+            "dependencies": {"conditions": {"names": ["npm://faker"]}}
+        }
+        self.assertTrue(
+            self.policy.checkViolation("all", "dependencies", names=["npm://faker"])
+        )
+
+        self.policy.policy = {
+            "dependencies": {"conditions": {"names": ["pip://faker"]}}
+        }
+        self.assertFalse(
+            self.policy.checkViolation("all", "dependencies", names=["npm://faker"])
+        )
+
+    def testTechnologyWithoutPolicy(self):
+        self.policy.policy = {"codescanning": {"level": "error"}}
+
+        self.assertTrue(self.policy.checkViolation("low", "dependencies"))
+        self.assertFalse(self.policy.checkViolation("unknown", "dependencies"))
+        self.assertFalse(self.policy.checkViolation("low", "codescanning"))
+
+    def testViolationDecisionCached(self):
+        self.policy.policy = {
+            "dependencies": {"conditions": {"names": ["npm://faker"]}}
+        }
+
+        with mock.patch.object(
+            Policy,
+            "checkViolationAgainstPolicy",
+            side_effect=Policy.checkViolationAgainstPolicy,
+            autospec=True,
+        ) as check:
+            for _ in range(3):
+                self.assertTrue(
+                    self.policy.checkViolation(
+                        "all", "dependencies", names=["npm://faker"]
+                    )
+                )
+
+        self.assertEqual(check.call_count, 1)
+
+    def testPolicyEditedInPlace(self):
+        self.policy.policy = {
+            "dependencies": {"conditions": {"names": ["npm://faker"]}}
+        }
+        self.assertTrue(
+            self.policy.checkViolation("all", "dependencies", names=["npm://faker"])
+        )
+
+        self.policy.policy["dependencies"]["conditions"]["names"] = ["pip://faker"]
+        self.policy.clearCaches()
+
+        self.assertFalse(
+            self.policy.checkViolation("all", "dependencies", names=["npm://faker"])
+        )
+
+    def testViolationDecisionCacheBounded(self):
+        self.policy.policy = {
+            "dependencies": {"conditions": {"names": ["npm://faker"]}}
+        }
+
+        with mock.patch.object(policy_module, "__DECISION_CACHE_SIZE__", 2):
+            for name in ["npm://a", "npm://b", "npm://c", "npm://faker"]:
+                self.policy.checkViolation("all", "dependencies", names=[name])
+
+        self.assertEqual(len(self.policy._decisions), 2)
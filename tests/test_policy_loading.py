@@ -1,12 +1,17 @@
 import os
 import sys
+import json
+import logging
+import shutil
 import yaml
 import uuid
 import unittest
 import tempfile
+from unittest import mock
 
 sys.path.append(".")
 
+from ghascompliance import policy as policy_module
 from ghascompliance.policy import Policy
 
 
@@ -23,6 +28,10 @@ class TestPolicyLoading(unittest.TestCase):
     def genTempFile(self, ext=".yml"):
         return os.path.join(tempfile.gettempdir(), str(uuid.uuid4()) + ext)
 
+    def removeFile(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+
     def writePolicyToFile(self, policy):
         with open(self.policy_file, "w") as handle:
             yaml.safe_dump(policy, handle)
@@ -36,6 +45,107 @@ class TestPolicyLoading(unittest.TestCase):
 
         self.assertEqual(policy.policy.get("general", {}).get("level"), "error")
 
+    def testCachedLoading(self):
+        self.writePolicyToFile({"general": {"level": "error"}})
+
+        policy = Policy("error", path=self.policy_file)
+        policy.policy["general"]["level"] = "warning"
+
+        # cached data is not modified by the previous policy
+        cached = Policy("error", path=self.policy_file)
+        self.assertEqual(cached.policy.get("general", {}).get("level"), "error")
+
+        # updating the file invalidates the cache
+        self.writePolicyToFile({"general": {"level": "critical"}})
+
+        updated = Policy("error", path=self.policy_file)
+        self.assertEqual(updated.policy.get("general", {}).get("level"), "critical")
+
+    def testJsonCacheLoading(self):
+        self.writePolicyToFile({"general": {"level": "error"}})
+        cache_path = self.policy_file + ".cache.json"
+        self.addCleanup(self.removeFile, cache_path)
+
+        with mock.patch.dict(os.environ, {"GHAS_POLICY_JSON_CACHE": "1"}):
+            Policy("error", path=self.policy_file)
+            self.assertTrue(os.path.exists(cache_path))
+
+            # force the sidecar to be used
+            policy_module.__POLICY_CACHE__.clear()
+            with mock.patch.object(policy_module.yaml, "load") as load:
+                policy = Policy("error", path=self.policy_file)
+            self.assertFalse(load.called)
+
+        self.assertEqual(policy.policy.get("general", {}).get("level"), "error")
+
+    def testJsonCacheMismatch(self):
+        self.writePolicyToFile({"codescanning": {"level": "critical"}})
+        cache_path = self.policy_file + ".cache.json"
+        self.addCleanup(self.removeFile, cache_path)
+
+        # sidecar that is newer than the policy but for different content
+        with open(cache_path, "w") as handle:
+            json.dump(
+                {
+                    "sha256": "0" * 64,
+                    "policy": {"codescanning": {"level": "none"}},
+                },
+                handle,
+            )
+
+        with mock.patch.dict(os.environ, {"GHAS_POLICY_JSON_CACHE": "1"}):
+            policy = Policy("error", path=self.policy_file)
+
+        self.assertEqual(policy.policy["codescanning"]["level"], "critical")
+        self.assertTrue(policy.checkViolation("critical", "codescanning"))
+
+        # the sidecar is replaced with one for the current policy
+        with open(cache_path, "r") as handle:
+            cache = json.load(handle)
+        self.assertEqual(cache["policy"]["codescanning"]["level"], "critical")
+
+    def testJsonCacheWriteFailure(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+
+        self.policy_file = os.path.join(directory, "policy.yml")
+        self.writePolicyToFile({"general": {"level": "error"}})
+
+        with mock.patch.dict(
+            os.environ, {"GHAS_POLICY_JSON_CACHE": "1"}
+        ), mock.patch.object(
+            policy_module.os, "replace", side_effect=OSError("replace failed")
+        ):
+            policy = Policy("error", path=self.policy_file)
+
+        self.assertEqual(policy.policy.get("general", {}).get("level"), "error")
+        # no partial sidecar or temp file is left next to the policy
+        self.assertEqual(os.listdir(directory), ["policy.yml"])
+
+    def testMissingPolicyFile(self):
+        with self.assertRaises(Exception) as context:
+            policy = Policy("error", path=self.policy_file)
+
+        self.assertTrue("Policy File does not exist" in str(context.exception))
+
+    def testSavePolicy(self):
+        self.writePolicyToFile({"general": {"level": "error"}})
+        policy = Policy("error", path=self.policy_file)
+
+        path = self.genTempFile(ext=".json")
+        self.addCleanup(self.removeFile, path)
+        policy.savePolicy(path)
+        with open(path, "r") as handle:
+            saved = handle.read()
+
+        # the output does not depend on the log level
+        with mock.patch.object(policy_module.Octokit.logger, "level", logging.DEBUG):
+            policy.savePolicy(path)
+        with open(path, "r") as handle:
+            self.assertEqual(handle.read(), saved)
+
+        self.assertEqual(json.loads(saved), policy.policy)
+
     def testUnwantedSection(self):
         self.writePolicyToFile({"codescanning": {"test": "error"}})
 
@@ -68,6 +178,47 @@ class TestPolicyLoading(unittest.TestCase):
 
         self.assertEqual(policy.policy["codescanning"]["conditions"]["ids"], data)
 
+    def testImportSkipsCommentsAndBlankLines(self):
+        path = self.genTempFile(ext=".txt")
+        self.writePolicyToFile(
+            {"codescanning": {"conditions": {"imports": {"ids": path}}}}
+        )
+
+        with open(path, "w") as handle:
+            handle.write("# comment\ntest\n\neach\b\nline\n")
+
+        policy = Policy("error", path=self.policy_file)
+
+        self.assertEqual(
+            policy.policy["codescanning"]["conditions"]["ids"], ["test", "each", "line"]
+        )
+
+    def testImportCached(self):
+        path = self.genTempFile(ext=".txt")
+        self.writePolicyToFile(
+            {
+                "codescanning": {"conditions": {"imports": {"ids": path}}},
+                "dependabot": {"ignores": {"imports": {"ids": path}}},
+            }
+        )
+
+        data = ["test", "each", "line"]
+        with open(path, "w") as handle:
+            handle.write("\n".join(data))
+
+        with mock.patch("builtins.open", side_effect=open) as opened:
+            policy = Policy("error", path=self.policy_file)
+
+        self.assertEqual(
+            len([c for c in opened.call_args_list if c.args[0] == path]), 1
+        )
+        self.assertEqual(policy.policy["codescanning"]["conditions"]["ids"], data)
+        self.assertEqual(policy.policy["dependabot"]["ignores"]["ids"], data)
+        self.assertIsNot(
+            policy.policy["codescanning"]["conditions"]["ids"],
+            policy.policy["dependabot"]["ignores"]["ids"],
+        )
+
     def testImportOfImports(self):
         self.writePolicyToFile(
             {"codescanning": {"conditions": {"imports": {"imports": "random"}}}}
@@ -143,3 +294,140 @@ class TestPolicyExamples(unittest.TestCase):
             policy.policy["licensing"]["warnings"]["names"],
             ["kibana"],
         )
+
+
+class TestPolicyLoadingFromRepo(unittest.TestCase):
+    def mockResponse(self, content: bytes, status_code: int = 200):
+        response = mock.Mock()
+        response.status_code = status_code
+        response.content = content
+        return response
+
+    def testFetchPolicyFile(self):
+        response = self.mockResponse(b"codescanning:\n  level: high\n")
+
+        with mock.patch.object(
+            policy_module.requests, "get", return_value=response
+        ) as get, mock.patch.object(
+            policy_module.Repository, "clone", side_effect=Exception("cloned")
+        ):
+            policy = Policy(
+                "error",
+                repository="advanced-security/policy-as-code-testing",
+                path="policies/policy.yml",
+                branch="main",
+                token="secret",
+            )
+
+        self.assertEqual(policy.policy.get("codescanning", {}).get("level"), "high")
+
+        url = get.call_args.args[0]
+        self.assertEqual(
+            url,
+            "https://api.github.com/repos/advanced-security/policy-as-code-testing/contents/policies/policy.yml",
+        )
+        self.assertEqual(get.call_args.kwargs["params"], {"ref": "main"})
+        self.assertEqual(
+            get.call_args.kwargs["headers"]["Authorization"], "token secret"
+        )
+
+    def testFetchPolicyFileWithImports(self):
+        response = self.mockResponse(
+            b"codescanning:\n  conditions:\n    imports:\n      ids: ids.txt\n"
+        )
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+
+        with mock.patch.object(
+            policy_module, "__TEMP_DIR__", temp_dir
+        ), mock.patch.object(
+            policy_module.requests, "get", return_value=response
+        ), mock.patch.object(
+            policy_module.Repository, "clone"
+        ) as clone:
+            with self.assertRaises(Exception) as context:
+                Policy("error", repository="advanced-security/policy-as-code-testing")
+
+        # imports need the repository so it falls back to cloning
+        self.assertTrue(clone.called)
+        self.assertTrue("Repository failed to clone" in str(context.exception))
+
+    def testUpdateClone(self):
+        policy = Policy("error")
+        policy.repository = policy_module.Repository.parseRepository(
+            "advanced-security/policy-as-code-testing"
+        )
+        policy.repository.clone_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, policy.repository.clone_path, True)
+
+        # not a git repository
+        self.assertFalse(policy.updateClone())
+
+        os.makedirs(os.path.join(policy.repository.clone_path, ".git"))
+        remote = policy.repository.clone_url.encode()
+
+        with mock.patch.object(
+            policy_module.subprocess, "check_output", return_value=b"other\n"
+        ), mock.patch.object(policy_module.subprocess, "check_call") as call:
+            self.assertFalse(policy.updateClone())
+            self.assertFalse(call.called)
+
+        with mock.patch.object(
+            policy_module.subprocess, "check_output", return_value=remote + b"\n"
+        ), mock.patch.object(policy_module.subprocess, "check_call") as call:
+            self.assertTrue(policy.updateClone())
+            self.assertEqual(call.call_args_list[0].args[0][:2], ["git", "fetch"])
+
+        # a clone made with an older token is still the same repository
+        policy.repository.repo_token = "new-token"
+        old_remote = (
+            b"https://old-token@github.com/advanced-security/policy-as-code-testing\n"
+        )
+        with mock.patch.object(
+            policy_module.subprocess, "check_output", return_value=old_remote
+        ), mock.patch.object(policy_module.subprocess, "check_call") as call:
+            self.assertTrue(policy.updateClone())
+            fetch = call.call_args_list[0].args[0]
+            self.assertIn(policy.repository.clone_url, fetch)
+            self.assertNotIn("old-token", " ".join(fetch))
+
+    def testLoadFromRepoReuseClone(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+
+        clone_path = os.path.join(temp_dir, "repo")
+        os.makedirs(os.path.join(clone_path, ".git"))
+        with open(os.path.join(clone_path, "policy.yml"), "w") as handle:
+            handle.write("general:\n  level: error\n")
+
+        remote = b"https://github.com/advanced-security/policy-as-code-testing.git\n"
+
+        def load(env: dict):
+            policy = Policy("error")
+            policy.repository = policy_module.Repository.parseRepository(
+                "advanced-security/policy-as-code-testing"
+            )
+            with mock.patch.object(
+                policy_module, "__TEMP_DIR__", temp_dir
+            ), mock.patch.dict(os.environ, env), mock.patch.object(
+                Policy, "fetchPolicyFile", return_value=None
+            ), mock.patch.object(
+                policy_module.subprocess, "check_output", return_value=remote
+            ), mock.patch.object(
+                policy_module.subprocess, "check_call"
+            ), mock.patch.object(
+                policy_module.Repository, "clone"
+            ) as clone:
+                policy.loadFromRepo()
+            return policy, clone
+
+        policy, clone = load({"GHAS_POLICY_REUSE_CLONE": "1"})
+        self.assertFalse(clone.called)
+        self.assertEqual(policy.policy.get("general", {}).get("level"), "error")
+
+        # without the opt-in the clone is always replaced
+        with mock.patch.dict(os.environ):
+            os.environ.pop("GHAS_POLICY_REUSE_CLONE", None)
+            with self.assertRaises(Exception):
+                load({})
+        self.assertFalse(os.path.exists(clone_path))
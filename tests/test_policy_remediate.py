@@ -116,3 +116,44 @@ class TestPolicyLoading(unittest.TestCase):
             sevendaysago,
         )
         self.assertTrue(result)
+
+    def testViolationRemediationFixedToday(self):
+        created = datetime.datetime(2023, 1, 1, 23, 59)
+
+        self.policy.loadPolicy(self.example)
+        remediate = self.example.get("codescanning", {}).get("remediate")
+
+        self.policy.today = datetime.date(2023, 1, 2)
+        self.assertFalse(
+            self.policy.checkViolationRemediation("error", remediate, created)
+        )
+
+        self.policy.today = datetime.date(2023, 1, 3)
+        self.assertTrue(
+            self.policy.checkViolationRemediation("error", remediate, created)
+        )
+
+    def testViolationDecisionFixedToday(self):
+        created = datetime.datetime(2023, 1, 1, 23, 59)
+        self.policy.loadPolicy(self.example)
+
+        self.policy.today = datetime.date(2023, 1, 2)
+        self.assertFalse(
+            self.policy.checkViolation("error", "codescanning", creation_time=created)
+        )
+
+        self.policy.today = datetime.date(2023, 1, 3)
+        self.assertTrue(
+            self.policy.checkViolation("error", "codescanning", creation_time=created)
+        )
+
+    def testViolationRemediationNoCreationTime(self):
+        self.policy.loadPolicy(self.example)
+        remediate = self.example.get("codescanning", {}).get("remediate")
+
+        self.assertFalse(
+            self.policy.checkViolationRemediation("error", remediate, None)
+        )
+        self.assertFalse(
+            self.policy.checkViolationRemediation("critical", remediate, None)
+        )
@@ -15,7 +15,8 @@ class TestPolicyLoadingRemote(unittest.TestCase):
         return super().setUp()
 
     def tearDown(self):
-        if os.path.exists(self.policy.temp_repo):
+        # policies fetched over the REST API are never cloned
+        if self.policy.temp_repo and os.path.exists(self.policy.temp_repo):
             shutil.rmtree(self.policy.temp_repo)
 
         return super().tearDown()
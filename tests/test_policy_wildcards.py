@@ -47,6 +47,29 @@ class TestPolicyLoading(unittest.TestCase):
         result = self.policy.matchContent(item, wildcards)
         self.assertTrue(result)
 
+    def testMatchEmptyValidators(self):
+        self.assertFalse(self.policy.matchContent("test", []))
+        self.assertFalse(self.policy.matchContent("", []))
+
+    def testMatchMultipleWildcards(self):
+        wildcards = ["example", "test-*", "*-suffix", "lib?"]
+
+        self.assertTrue(self.policy.matchContent("test-one", wildcards))
+        self.assertTrue(self.policy.matchContent("name-suffix", wildcards))
+        self.assertTrue(self.policy.matchContent("libs", wildcards))
+        self.assertFalse(self.policy.matchContent("libss", wildcards))
+        self.assertFalse(self.policy.matchContent("example-test", wildcards))
+
+    def testMatchLiteralContent(self):
+        wildcards = ["lib.name", "maven://org.apache.struts#2.0.5"]
+
+        self.assertTrue(self.policy.matchContent("lib.name", wildcards))
+        self.assertFalse(self.policy.matchContent("lib-name", wildcards))
+        self.assertTrue(
+            self.policy.matchContent("maven://org.apache.struts#2.0.5", wildcards)
+        )
+        self.assertFalse(self.policy.matchContent("lib.name.other", wildcards))
+
     def testLoadingAndMatching(self):
         policy_path = "tests/samples/wildcards.yml"
         self.assertTrue(os.path.exists(policy_path))